@@ -10,17 +10,42 @@ Personalization rules implemented:
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-import json
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+import hashlib
 import os
+import time
 from typing import Protocol
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
+import orjson
+from pydantic import BaseModel
+
+from .batching import GenerationBatcher
+from .schemas import DifficultyLevel, Pillar
 
 # Canonical developmental pillars.
 PILLARS = ["Cognitive", "Physical", "Language", "Character", "Creativity"]
 DIFFICULTY_ORDER = ["easy", "medium", "hard"]
 
+# Parent priority keywords mapped to the pillar they most likely target.
+PRIORITY_MAP = {
+    "study": "Cognitive",
+    "fitness": "Physical",
+    "exercise": "Physical",
+    "language": "Language",
+    "communication": "Language",
+    "behavior": "Character",
+    "discipline": "Character",
+    "creative": "Creativity",
+    "art": "Creativity",
+}
+
+# Parsed model responses are reused for identical generation inputs.
+RESPONSE_CACHE_TTL_SECONDS = 1800
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
 # Stoic-inspired character lesson prompts to include in each generated plan.
 STOIC_CHARACTER_TEMPLATES = [
     {
@@ -65,10 +90,198 @@ class GenerationStrategy:
     low_pillar: str | None = None
 
 
+class ResponseCache:
+    """In-process TTL cache for parsed model responses.
+
+    Keys are SHA256 digests of every generation input, so plans only share an
+    entry when model, age, priority, and strategy all match.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, list[dict]]] = {}
+
+    @staticmethod
+    def make_key(
+        *,
+        model: str,
+        age: int,
+        parent_priority: str,
+        strategy: GenerationStrategy,
+    ) -> str:
+        payload = {
+            "model": model,
+            "age": age,
+            "parent_priority": parent_priority,
+            "strategy": asdict(strategy),
+        }
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get(self, key: str) -> list[dict] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, tasks = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        # Callers adjust tasks in place, so hand out copies.
+        return [dict(task) for task in tasks]
+
+    def set(self, key: str, tasks: list[dict]) -> None:
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (
+            time.monotonic() + self.ttl_seconds,
+            [dict(task) for task in tasks],
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_RESPONSE_CACHE = ResponseCache()
+
+# Invariant instructions sent ahead of the per-child parameters. Keeping this
+# block byte-identical across requests lets the provider reuse its prompt
+# prefix cache, so only the short user message is billed at the full rate.
+STATIC_INSTRUCTION_BLOCK = """\
+You generate developmental daily tasks for children and young adults aged 0-21.
+
+INPUT
+The user message is a JSON object with these keys:
+- age: child age in whole years (0-21).
+- parent_priority: free-text focus chosen by the parent or guardian.
+- target_pillars: ordered list of pillars; generate exactly one task per entry, in that order.
+- difficulty_bias: -1 means make tasks easier, 0 means neutral, 1 means make tasks harder.
+- duration_scale: multiplier for typical task length (below 1.0 means shorter tasks).
+- low_pillar: pillar the child has struggled with recently, or null. When present, make
+  that pillar's task especially engaging and achievable.
+
+OUTPUT
+Return a JSON object {"tasks": [...]} and nothing else: no prose, no markdown fences.
+Each element of tasks is an object with exactly these keys:
+- pillar: one of "Cognitive", "Physical", "Language", "Character", "Creativity".
+- title: short task name, at most 8 words.
+- description: one or two sentences written for the parent or child, matched to the age.
+- duration_minutes: integer between 5 and 180.
+- difficulty_level: one of "easy", "medium", "hard".
+The tasks length must equal the length of target_pillars, and element i must use
+target_pillars[i] as its pillar.
+
+PILLAR CATALOG
+- Cognitive: reasoning, memory, attention, numeracy, and problem solving.
+  Example: "Focus Sprint Puzzle" - solve one age-appropriate logic puzzle.
+- Physical: gross and fine motor skills, fitness, balance, coordination, and rest habits.
+  Example: "Movement Circuit" - a short routine with stretching and balance.
+- Language: listening, speaking, reading, writing, and vocabulary.
+  Example: "Story Retell" - read or listen to a short story and retell key points aloud.
+- Character: kindness, responsibility, self-control, gratitude, and honesty.
+  Example: "Kindness Action" - plan and complete one helpful action for family or friends.
+- Creativity: art, music, building, imaginative play, and original expression.
+  Example: "Create and Share" - make a drawing, beat, or craft and explain the choices.
+
+DIFFICULTY LEVELS
+- easy: can be finished independently or with light guidance on the first try.
+- medium: needs sustained focus or a few steps; light adult support is fine.
+- hard: multi-step, stretches current ability, and may need planning or practice.
+
+AGE GUIDANCE
+- 0-3: parent-led play, sensory exploration, very short sessions, simple words.
+- 4-7: concrete examples, short sentences, playful framing, frequent movement.
+- 8-12: practical projects, one written reflection, growing independence.
+- 13-16: self-directed goals, personal responsibility, reflective journaling.
+- 17-21: independent planning, mastery in a chosen domain, real-world decisions.
+
+Tasks must be safe, inexpensive, doable at home or nearby, and respectful of the
+parent's priority without ignoring the requested pillar.
+
+EXAMPLE
+Input:
+{"age": 9, "parent_priority": "study habits", "target_pillars": ["Cognitive", "Physical",
+"Language", "Character", "Creativity"], "difficulty_bias": 0, "duration_scale": 1.0,
+"low_pillar": "Language"}
+Output:
+{"tasks": [
+  {"pillar": "Cognitive", "title": "Homework Focus Sprint", "description": "Set a timer and
+  finish one homework section without switching tasks, then check your answers.",
+  "duration_minutes": 20, "difficulty_level": "medium"},
+  {"pillar": "Physical", "title": "Jump Rope Countdown", "description": "Do five rounds of
+  jump rope, counting aloud and resting between rounds.", "duration_minutes": 15,
+  "difficulty_level": "easy"},
+  {"pillar": "Language", "title": "Comic Strip Retell", "description": "Read a short chapter
+  and retell it as a four-panel comic with one sentence per panel.", "duration_minutes": 20,
+  "difficulty_level": "easy"},
+  {"pillar": "Character", "title": "Tidy Before Play", "description": "Put away your school
+  things before free time and tell a parent what you finished.", "duration_minutes": 10,
+  "difficulty_level": "easy"},
+  {"pillar": "Creativity", "title": "Invent a Board Game", "description": "Design a simple
+  board game with three rules and play one round with family.", "duration_minutes": 30,
+  "difficulty_level": "medium"}
+]}
+"""
+
+
+class GeneratedTask(BaseModel):
+    """One task as returned by the model's structured output."""
+
+    pillar: Pillar
+    title: str
+    description: str
+    duration_minutes: int
+    difficulty_level: DifficultyLevel
+
+
+class GeneratedTaskList(BaseModel):
+    """Structured-output schema for one plan."""
+
+    tasks: list[GeneratedTask]
+
+
+class GeneratedTaskBatch(BaseModel):
+    """Structured-output schema for a batched call, one plan per request."""
+
+    plans: list[GeneratedTaskList]
+
+
+# Appended after the static block when several children share one call.
+BATCH_INSTRUCTION = """\
+BATCH MODE
+The user message is a JSON object {"batch": [...]} whose entries each follow the INPUT
+format above. Return a JSON object {"plans": [...]} with one element per batch entry, in
+the same order, where each element is the {"tasks": [...]} object for that entry.
+"""
+
+
+def _generation_params(age: int, parent_priority: str, strategy: GenerationStrategy) -> dict:
+    """Per-request values sent after the static instruction block."""
+    return {
+        "age": age,
+        "parent_priority": parent_priority,
+        "target_pillars": strategy.target_pillars,
+        "difficulty_bias": strategy.difficulty_bias,
+        "duration_scale": strategy.duration_scale,
+        "low_pillar": strategy.low_pillar,
+    }
+
+
+def _validate_task_list(parsed: GeneratedTaskList, task_count: int) -> list[dict]:
+    """Ensure one structured model response holds the expected number of tasks."""
+    if len(parsed.tasks) != task_count:
+        raise ValueError(f"Model response must be a list of {task_count} tasks")
+    return [task.model_dump() for task in parsed.tasks]
+
+
 class TaskGenerationAdapter(Protocol):
     """Adapter protocol to support different model providers/backends."""
 
-    def generate(
+    async def generate(
         self,
         *,
         age: int,
@@ -78,106 +291,245 @@ class TaskGenerationAdapter(Protocol):
         """Return structured tasks for the requested strategy and pillars."""
 
 
+# Keep-alive HTTP/2 pool shared by every OpenAI adapter, so TLS handshakes are
+# paid once and concurrent plan requests multiplex over the same connection.
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client used for model provider calls."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared provider HTTP client; called on app shutdown.
+
+    Memoized adapters and their batchers hold the closed client, so they are
+    dropped too and the next lifespan builds fresh ones.
+    """
+    global _HTTP_CLIENT
+    _select_adapter.cache_clear()
+    for batcher in _BATCHERS.values():
+        batcher.close()
+    _BATCHERS.clear()
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
 class OpenAIResponsesAdapter:
     """Default adapter backed by OpenAI Responses API."""
 
     def __init__(self, model: str = "gpt-4o-mini"):
         self.model = model
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=_shared_http_client(),
+        )
 
-    def generate(
+    async def generate(
         self,
         *,
         age: int,
         parent_priority: str,
         strategy: GenerationStrategy,
     ) -> list[dict]:
-        task_count = len(strategy.target_pillars)
-        prompt = (
-            "You generate developmental daily tasks for ages 0-21. "
-            f"Child age: {age}. Parent priority: {parent_priority}. "
-            f"Generate {task_count} tasks for pillars in this exact order: {strategy.target_pillars}. "
-            f"Difficulty bias: {strategy.difficulty_bias} (1=harder, -1=easier). "
-            f"Duration scale: {strategy.duration_scale}. "
-            f"Low pillar to emphasize: {strategy.low_pillar}. "
-            "Return STRICT JSON array with objects that include keys: "
-            "pillar, title, description, duration_minutes, difficulty_level. "
-            "difficulty_level must be one of easy|medium|hard."
+        cache_key = self._cache_key(age=age, parent_priority=parent_priority, strategy=strategy)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = _generation_params(age, parent_priority, strategy)
+
+        # Static instructions first, per-request parameters last.
+        # The response is schema-constrained, so no JSON parsing or type checks.
+        response = await self.client.responses.parse(
+            model=self.model,
+            input=[
+                {"role": "system", "content": STATIC_INSTRUCTION_BLOCK},
+                {"role": "user", "content": orjson.dumps(params).decode()},
+            ],
+            text_format=GeneratedTaskList,
+        )
+        if response.output_parsed is None:
+            # Refusals and replies without a parsed text part carry no tasks.
+            raise ValueError("Model response did not include a parsed task list")
+        tasks = _validate_task_list(response.output_parsed, len(strategy.target_pillars))
+        _RESPONSE_CACHE.set(cache_key, tasks)
+        return tasks
+
+    async def generate_batch(self, requests: list[dict]) -> list[list[dict] | Exception]:
+        """Generate tasks for several requests with one shared provider call.
+
+        Each request holds the keyword arguments accepted by `generate`. Results
+        line up with `requests`; an entry is either its task list or the
+        exception raised for that request alone. Entries the batch reply got
+        wrong are retried through `generate`, as is every entry when the reply
+        has no parsed plans or the wrong number of them, so one bad plan does
+        not fail its neighbours.
+        """
+        results: list[list[dict] | Exception | None] = []
+        misses: list[tuple[int, str, dict]] = []
+        for index, request in enumerate(requests):
+            cache_key = self._cache_key(**request)
+            cached = _RESPONSE_CACHE.get(cache_key)
+            results.append(cached)
+            if cached is None:
+                misses.append((index, cache_key, request))
+
+        if misses:
+            batch_params = [
+                _generation_params(r["age"], r["parent_priority"], r["strategy"])
+                for _, _, r in misses
+            ]
+            response = await self.client.responses.parse(
+                model=self.model,
+                input=[
+                    {"role": "system", "content": STATIC_INSTRUCTION_BLOCK},
+                    {"role": "system", "content": BATCH_INSTRUCTION},
+                    {"role": "user", "content": orjson.dumps({"batch": batch_params}).decode()},
+                ],
+                text_format=GeneratedTaskBatch,
+            )
+            parsed = response.output_parsed
+
+            retry: list[tuple[int, dict]] = []
+            if parsed is None or len(parsed.plans) != len(misses):
+                retry = [(index, request) for index, _, request in misses]
+            else:
+                for (index, cache_key, request), plan in zip(misses, parsed.plans):
+                    try:
+                        tasks = _validate_task_list(plan, len(request["strategy"].target_pillars))
+                    except ValueError:
+                        retry.append((index, request))
+                        continue
+                    _RESPONSE_CACHE.set(cache_key, tasks)
+                    results[index] = tasks
+
+            if retry:
+                outcomes = await asyncio.gather(
+                    *(self.generate(**request) for _, request in retry),
+                    return_exceptions=True,
+                )
+                for (index, _), outcome in zip(retry, outcomes):
+                    results[index] = outcome
+
+        return results
+
+    def _cache_key(
+        self,
+        *,
+        age: int,
+        parent_priority: str,
+        strategy: GenerationStrategy,
+    ) -> str:
+        return ResponseCache.make_key(
+            model=self.model,
+            age=age,
+            parent_priority=parent_priority,
+            strategy=strategy,
         )
 
-        response = self.client.responses.create(model=self.model, input=prompt)
-        raw = response.output_text.strip()
-        parsed = json.loads(raw)
-        if not isinstance(parsed, list) or len(parsed) != task_count:
-            raise ValueError(f"Model response must be a list of {task_count} tasks")
-        return parsed
+
+# Fallback task per pillar: (title, description, duration_minutes, difficulty_level).
+# Only the Cognitive description depends on the request and is formatted per call.
+_FALLBACK_SEED: dict[str, tuple[str, str, int, str]] = {
+    "Cognitive": (
+        "Focus Sprint Puzzle",
+        "Solve one age-{age} logic puzzle aligned with {priority}.",
+        20,
+        "medium",
+    ),
+    "Physical": (
+        "Movement Circuit",
+        "Complete a short movement routine with stretching and balance.",
+        25,
+        "easy",
+    ),
+    "Language": (
+        "Story Retell",
+        "Read/listen to a short story and retell key points aloud.",
+        15,
+        "easy",
+    ),
+    "Character": (
+        "Kindness Action",
+        "Plan and complete one helpful action for family or friends.",
+        10,
+        "easy",
+    ),
+    "Creativity": (
+        "Create and Share",
+        "Create a drawing, beat, or short craft and explain your choices.",
+        30,
+        "medium",
+    ),
+}
 
 
 class StaticFallbackAdapter:
     """Deterministic fallback if no external model is configured/available."""
 
-    def generate(
+    async def generate(
         self,
         *,
         age: int,
         parent_priority: str,
         strategy: GenerationStrategy,
     ) -> list[dict]:
-        seed = {
-            "Cognitive": (
-                "Focus Sprint Puzzle",
-                f"Solve one age-{age} logic puzzle aligned with {parent_priority}.",
-                20,
-                "medium",
-            ),
-            "Physical": (
-                "Movement Circuit",
-                "Complete a short movement routine with stretching and balance.",
-                25,
-                "easy",
-            ),
-            "Language": (
-                "Story Retell",
-                "Read/listen to a short story and retell key points aloud.",
-                15,
-                "easy",
-            ),
-            "Character": (
-                "Kindness Action",
-                "Plan and complete one helpful action for family or friends.",
-                10,
-                "easy",
-            ),
-            "Creativity": (
-                "Create and Share",
-                "Create a drawing, beat, or short craft and explain your choices.",
-                30,
-                "medium",
-            ),
-        }
+        return [
+            {
+                "pillar": pillar,
+                "title": title,
+                "description": (
+                    description.format(age=age, priority=parent_priority)
+                    if pillar == "Cognitive"
+                    else description
+                ),
+                "duration_minutes": duration,
+                "difficulty_level": difficulty,
+            }
+            for pillar in strategy.target_pillars
+            for title, description, duration, difficulty in (_FALLBACK_SEED[pillar],)
+        ]
 
-        tasks: list[dict] = []
-        for pillar in strategy.target_pillars:
-            title, description, duration, difficulty = seed[pillar]
-            tasks.append(
-                {
-                    "pillar": pillar,
-                    "title": title,
-                    "description": description,
-                    "duration_minutes": duration,
-                    "difficulty_level": difficulty,
-                }
-            )
-        return tasks
 
+# Resolved once; adapters below are memoized and reuse their clients.
+_HAS_OPENAI_KEY = bool(os.getenv("OPENAI_API_KEY"))
+_FALLBACK = StaticFallbackAdapter()
 
+
+@lru_cache(maxsize=8)
 def _select_adapter(model_hint: str | None = None) -> TaskGenerationAdapter:
     """Resolve adapter by model hint while keeping a safe fallback."""
     if model_hint == "fallback":
-        return StaticFallbackAdapter()
-    if os.getenv("OPENAI_API_KEY"):
+        return _FALLBACK
+    if _HAS_OPENAI_KEY:
         return OpenAIResponsesAdapter(model=model_hint or "gpt-4o-mini")
-    return StaticFallbackAdapter()
+    return _FALLBACK
+
+
+# One batcher per model so concurrent requests for that model share calls.
+_BATCHERS: dict[str, GenerationBatcher] = {}
+
+
+def _batcher_for(adapter: OpenAIResponsesAdapter) -> GenerationBatcher:
+    """Return the shared batcher for the adapter's model."""
+    batcher = _BATCHERS.get(adapter.model)
+    if batcher is None:
+        batcher = _BATCHERS[adapter.model] = GenerationBatcher(adapter)
+    return batcher
 
 
 def _derive_strategy(signals: PersonalizationSignal, parent_priority: str) -> GenerationStrategy:
@@ -218,6 +570,15 @@ def _prioritize_pillars_for_reduced_load(
     max_tasks: int,
 ) -> list[str]:
     """Select which pillars remain when reducing load, preserving personalization."""
+    return list(_prioritized_pillars(low_pillar, parent_priority, max_tasks))
+
+
+@lru_cache(maxsize=64)
+def _prioritized_pillars(
+    low_pillar: str | None,
+    parent_priority: str,
+    max_tasks: int,
+) -> tuple[str, ...]:
     ordered: list[str] = []
 
     # Keep low-performing pillar in rotation first when applicable.
@@ -225,19 +586,10 @@ def _prioritize_pillars_for_reduced_load(
         ordered.append(low_pillar)
 
     # Map parent priority text to a likely pillar and keep it near front.
-    priority_map = {
-        "study": "Cognitive",
-        "fitness": "Physical",
-        "exercise": "Physical",
-        "language": "Language",
-        "communication": "Language",
-        "behavior": "Character",
-        "discipline": "Character",
-        "creative": "Creativity",
-        "art": "Creativity",
-    }
+    # The first PRIORITY_MAP keyword found wins, so map order sets precedence;
+    # substring matching also catches inflected forms such as "artistic".
     normalized_priority = parent_priority.lower()
-    matched = next((v for k, v in priority_map.items() if k in normalized_priority), None)
+    matched = next((v for k, v in PRIORITY_MAP.items() if k in normalized_priority), None)
     if matched and matched not in ordered:
         ordered.append(matched)
 
@@ -245,19 +597,18 @@ def _prioritize_pillars_for_reduced_load(
         if pillar not in ordered:
             ordered.append(pillar)
 
-    return ordered[:max_tasks]
+    return tuple(ordered[:max_tasks])
 
 
-def _shift_difficulty(level: str, bias: int) -> str:
-    """Shift difficulty one step up/down based on strategy bias."""
-    try:
-        index = DIFFICULTY_ORDER.index(level)
-    except ValueError:
-        index = 1
-    index = max(0, min(len(DIFFICULTY_ORDER) - 1, index + bias))
-    return DIFFICULTY_ORDER[index]
+# (level, bias) -> shifted level, clamped to the ends of DIFFICULTY_ORDER.
+_SHIFT: dict[tuple[str, int], str] = {
+    (level, bias): DIFFICULTY_ORDER[max(0, min(len(DIFFICULTY_ORDER) - 1, index + bias))]
+    for index, level in enumerate(DIFFICULTY_ORDER)
+    for bias in (-1, 0, 1)
+}
 
 
+@lru_cache(maxsize=32)
 def _age_scaled_character_config(age: int) -> dict[str, str | int]:
     """Return age-specific settings for character lesson complexity and duration."""
     if age <= 3:
@@ -291,13 +642,16 @@ def _age_scaled_character_config(age: int) -> dict[str, str | int]:
     }
 
 
+# Stoic task templates per age; populated lazily and pre-warmed for ages 0-21.
+_STOIC_TASKS_BY_AGE: dict[int, tuple[dict, ...]] = {}
+
+
 def _build_stoic_character_tasks(age: int) -> list[dict]:
     """Build required Stoic character tasks and scale them to age."""
-    cfg = _age_scaled_character_config(age)
-    tasks: list[dict] = []
-
-    for template in STOIC_CHARACTER_TEMPLATES:
-        tasks.append(
+    cached = _STOIC_TASKS_BY_AGE.get(age)
+    if cached is None:
+        cfg = _age_scaled_character_config(age)
+        cached = _STOIC_TASKS_BY_AGE[age] = tuple(
             {
                 "pillar": "Character",
                 "title": template["title"],
@@ -305,33 +659,39 @@ def _build_stoic_character_tasks(age: int) -> list[dict]:
                 "duration_minutes": cfg["duration_minutes"],
                 "difficulty_level": cfg["difficulty_level"],
             }
+            for template in STOIC_CHARACTER_TEMPLATES
         )
-    return tasks
+
+    # Hand out copies so callers can never alter the cached templates.
+    return [dict(task) for task in cached]
+
+
+for _age in range(22):
+    _build_stoic_character_tasks(_age)
+del _age
 
 
 def _post_process_tasks(tasks: list[dict], strategy: GenerationStrategy) -> list[dict]:
     """Apply deterministic personalization adjustments after model generation."""
+    scale = strategy.duration_scale
+    bias = strategy.difficulty_bias
+    low = strategy.low_pillar
+    shift = _SHIFT
+    fallback_difficulty = shift[("medium", bias)]
+
     adjusted: list[dict] = []
     for task in tasks:
-        pillar = task.get("pillar")
-        duration = int(task.get("duration_minutes", 20))
-        difficulty = str(task.get("difficulty_level", "medium"))
-
-        # Rule 2: decrease duration when completion is weak.
-        duration = max(8, int(round(duration * strategy.duration_scale)))
-
-        # Rule 1/2: adjust complexity.
-        difficulty = _shift_difficulty(difficulty, strategy.difficulty_bias)
+        # Rule 2: decrease duration when completion is weak (half-up rounding).
+        duration = max(8, int(task["duration_minutes"] * scale + 0.5))
 
         # Rule 3: if a pillar is consistently low, boost exposure slightly.
-        if strategy.low_pillar and pillar == strategy.low_pillar:
-            duration = int(round(duration * 1.15))
-            task["description"] = (
-                f"(Priority pillar focus) {task.get('description', '')}".strip()
-            )
+        if low and task["pillar"] == low:
+            duration = int(duration * 1.15 + 0.5)
+            task["description"] = "(Priority pillar focus) " + task["description"]
 
         task["duration_minutes"] = duration
-        task["difficulty_level"] = difficulty
+        # Rule 1/2: adjust complexity.
+        task["difficulty_level"] = shift.get((task["difficulty_level"], bias), fallback_difficulty)
         adjusted.append(task)
 
     return adjusted
@@ -346,12 +706,19 @@ async def generateDailyTasks(
     """Generate personalized next tasks and schedule based on behavior signals."""
     strategy = _derive_strategy(signals or PersonalizationSignal(), parent_priority)
     adapter = _select_adapter(model_hint)
-    tasks = await asyncio.to_thread(
-        adapter.generate,
-        age=age,
-        parent_priority=parent_priority,
-        strategy=strategy,
-    )
+    if isinstance(adapter, OpenAIResponsesAdapter):
+        # Coalesce concurrent plan requests into shared provider calls.
+        tasks = await _batcher_for(adapter).submit(
+            age=age,
+            parent_priority=parent_priority,
+            strategy=strategy,
+        )
+    else:
+        tasks = await adapter.generate(
+            age=age,
+            parent_priority=parent_priority,
+            strategy=strategy,
+        )
 
     # Normalize by requested pillar order and enforce required count.
     by_pillar: dict[str, dict] = {task["pillar"]: task for task in tasks if "pillar" in task}
@@ -0,0 +1,103 @@
+"""Micro-batching for model-backed task generation.
+
+Plan requests that arrive close together are coalesced into one provider call,
+so concurrent children share a single round-trip and the static prompt prefix
+is sent once per batch instead of once per child.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+# Upper bound of plan requests folded into one provider call.
+MAX_BATCH = 16
+# How long the worker waits for more requests once one is queued.
+BATCH_WINDOW_SECONDS = 0.05
+
+
+class GenerationBatcher:
+    """Coalesce concurrent `generate` calls for one adapter into batched calls.
+
+    The adapter must expose coroutines `generate(**params) -> list[dict]` and
+    `generate_batch(list[params]) -> list[list[dict] | Exception]`, where an
+    exception entry fails only that caller. When nothing is queued or in flight,
+    a request skips the window and calls `generate` directly.
+    """
+
+    def __init__(
+        self,
+        adapter: Any,
+        *,
+        max_batch: int = MAX_BATCH,
+        window_seconds: float = BATCH_WINDOW_SECONDS,
+    ):
+        self.adapter = adapter
+        self.max_batch = max_batch
+        self.window_seconds = window_seconds
+        self._queue: asyncio.Queue[tuple[dict, asyncio.Future]] | None = None
+        self._worker: asyncio.Task | None = None
+        self._inflight = 0
+
+    async def submit(self, **params: Any) -> list[dict]:
+        """Generate tasks for one request, batching with concurrent callers."""
+        queue = self._ensure_worker()
+
+        # Fast path: an idle batcher has nothing to coalesce with.
+        if self._inflight == 0 and queue.empty():
+            self._inflight += 1
+            try:
+                return await self.adapter.generate(**params)
+            finally:
+                self._inflight -= 1
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await queue.put((params, future))
+        return await future
+
+    def close(self) -> None:
+        """Stop the background worker; a later `submit` starts a new one."""
+        if self._worker is not None:
+            self._worker.cancel()
+        self._queue = None
+        self._worker = None
+
+    def _ensure_worker(self) -> asyncio.Queue[tuple[dict, asyncio.Future]]:
+        if self._queue is None or self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[tuple[dict, asyncio.Future]]) -> None:
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.window_seconds)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            self._inflight += 1
+            try:
+                await self._dispatch(batch)
+            finally:
+                self._inflight -= 1
+
+    async def _dispatch(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                params, _ = batch[0]
+                results = [await self.adapter.generate(**params)]
+            else:
+                results = await self.adapter.generate_batch([params for params, _ in batch])
+        except Exception as exc:  # noqa: BLE001 - fan the failure out to every caller.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), outcome in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
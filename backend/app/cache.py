@@ -0,0 +1,120 @@
+"""Response-body caching for read-heavy LifeOS 0-21 routes.
+
+Encoded JSON bodies are cached per key with a TTL. When `REDIS_URL` is set the
+cache is shared by every worker through Redis; otherwise each process keeps its
+own in-memory copy.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Protocol
+
+# Profiles and milestone statuses change rarely; writes invalidate explicitly.
+CACHE_TTL_SECONDS = 300
+# Bound for the per-process fallback store; the oldest body is evicted first.
+CACHE_MAX_ENTRIES = 4096
+CACHE_PREFIX = "lifeos"
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+class CacheBackend(Protocol):
+    """Storage protocol for cached response bodies."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached body, or None on a miss."""
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int) -> None:
+        """Store a body for `ttl_seconds`."""
+
+    async def delete(self, *keys: str) -> None:
+        """Drop the given keys if present."""
+
+
+class InMemoryBackend:
+    """Per-process TTL store used when Redis is not configured."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, bytes]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return body
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int) -> None:
+        # Re-inserting moves the key to the end, keeping dict order oldest-first.
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl_seconds, body)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisBackend:
+    """Redis-backed store shared across workers.
+
+    Redis failures are treated as cache misses so reads fall back to Postgres.
+    """
+
+    def __init__(self, url: str) -> None:
+        from redis import asyncio as redis_asyncio
+        from redis.exceptions import RedisError
+
+        self._client = redis_asyncio.from_url(url)
+        self._errors = RedisError
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self._client.get(key)
+        except self._errors:
+            return None
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int) -> None:
+        try:
+            await self._client.set(key, body, ex=ttl_seconds)
+        except self._errors:
+            pass
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self._client.delete(*keys)
+        except self._errors:
+            pass
+
+
+class RouteCache:
+    """Namespaced response-body cache used by the routers."""
+
+    def __init__(self, backend: CacheBackend, prefix: str = CACHE_PREFIX) -> None:
+        self.backend = backend
+        self.prefix = prefix
+
+    def profile_key(self, child_id: int) -> str:
+        return f"{self.prefix}:profile:{child_id}"
+
+    def milestones_key(self, child_id: int) -> str:
+        return f"{self.prefix}:ms:{child_id}"
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, body: bytes, ttl_seconds: int = CACHE_TTL_SECONDS) -> None:
+        await self.backend.set(key, body, ttl_seconds)
+
+    async def invalidate_child(self, child_id: int) -> None:
+        """Drop every cached body derived from one child's data."""
+        await self.backend.delete(self.profile_key(child_id), self.milestones_key(child_id))
+
+
+route_cache = RouteCache(RedisBackend(REDIS_URL) if REDIS_URL else InMemoryBackend())
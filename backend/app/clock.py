@@ -0,0 +1,36 @@
+"""Process-wide cached calendar date.
+
+`today()` returns a module-level date that a background task started at app
+startup keeps current, so schema defaults read a cached value instead of
+resolving the system clock per call. CRUD date math calls `date.today()`
+directly so it stays correct when the lifespan does not run.
+"""
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+# Longest sleep between refreshes. Naive local datetimes misjudge the time to
+# midnight across DST changes, so the task re-checks at least this often.
+REFRESH_INTERVAL_SECONDS = 60.0
+
+_TODAY: date = date.today()
+
+
+def today() -> date:
+    """Return the cached local calendar date.
+
+    Outside the app lifespan nothing refreshes it, so it stays at the import date.
+    """
+    return _TODAY
+
+
+async def refresh_today() -> None:
+    """Keep the cached date current, re-checking every minute; runs until cancelled."""
+    global _TODAY
+    while True:
+        # One clock read, so the cached date and the next sleep always agree.
+        now = datetime.now()
+        _TODAY = now.date()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+        remaining = (next_midnight - now).total_seconds()
+        await asyncio.sleep(min(remaining, REFRESH_INTERVAL_SECONDS))
@@ -1,9 +1,21 @@
 """Async CRUD logic for child profiles, daily plans, milestones, and progress metrics."""
 
-from collections import defaultdict
+from collections.abc import Sequence
 from datetime import date, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Integer,
+    String,
+    cast,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from . import ai_generator, models, schemas
@@ -27,98 +39,128 @@ MILESTONE_LIBRARY: list[dict[str, str]] = [
     {"age_phase": "Phase 5 (17-21)", "focus": "independence", "title": "Plans and executes independent life routines"},
 ]
 
+# Rows are read as plain column mappings rather than ORM entities, so response
+# models are built from dicts without per-field ORM attribute access.
+_PROFILE_COLUMNS = tuple(models.ChildProfile.__table__.columns)
+_TASK_COLUMNS = tuple(models.DailyTask.__table__.columns)
 
-async def create_profile(db: AsyncSession, payload: schemas.ChildProfileCreate) -> models.ChildProfile:
-    """Create and persist a new child profile."""
-    profile = models.ChildProfile(**payload.model_dump())
-    db.add(profile)
+# Precomputed (age_phase, focus, title, lookup key) rows for milestone responses.
+_MILESTONE_TEMPLATES: tuple[tuple[str, str, str, tuple[str, str]], ...] = tuple(
+    (item["age_phase"], item["focus"], item["title"], (item["age_phase"], item["title"]))
+    for item in MILESTONE_LIBRARY
+)
+
+
+async def create_profile(db: AsyncSession, payload: schemas.ChildProfileCreate) -> RowMapping:
+    """Create and persist a new child profile, returning the stored row."""
+    result = await db.execute(
+        insert(models.ChildProfile)
+        .values(**payload.model_dump())
+        .returning(*_PROFILE_COLUMNS)
+    )
+    profile = result.mappings().one()
     await db.commit()
-    await db.refresh(profile)
     return profile
 
 
-async def get_profile(db: AsyncSession, child_id: int) -> models.ChildProfile | None:
-    """Fetch one child profile by ID."""
+async def get_profile(db: AsyncSession, child_id: int) -> RowMapping | None:
+    """Fetch one child profile row by ID."""
     result = await db.execute(
-        select(models.ChildProfile).where(models.ChildProfile.id == child_id)
+        select(*_PROFILE_COLUMNS).where(models.ChildProfile.id == child_id)
     )
-    return result.scalar_one_or_none()
+    return result.mappings().one_or_none()
 
 
-async def get_milestones_for_child(db: AsyncSession, child_id: int) -> list[schemas.MilestoneStatusOut]:
-    """Return milestone examples across all phases with achieved status for a child."""
+async def get_profile_with_milestones(
+    db: AsyncSession, child_id: int
+) -> list[schemas.MilestoneStatusOut] | None:
+    """Return milestone statuses for a child, or None if the profile does not exist.
+
+    One round-trip answers both questions: the profile row is LEFT JOINed to the
+    child's achieved milestones, so an empty result means no profile and NULL
+    milestone columns mean nothing achieved yet. The catalog itself is static.
+    """
     result = await db.execute(
-        select(models.Milestone).where(models.Milestone.child_id == child_id)
-    )
-    rows = result.scalars().all()
-    achieved_map = {(row.age_phase, row.title): row.achieved for row in rows}
-
-    milestones: list[schemas.MilestoneStatusOut] = []
-    for item in MILESTONE_LIBRARY:
-        key = (item["age_phase"], item["title"])
-        milestones.append(
-            schemas.MilestoneStatusOut(
-                age_phase=item["age_phase"],
-                focus=item["focus"],
-                title=item["title"],
-                achieved=achieved_map.get(key, False),
-            )
+        select(models.Milestone.age_phase, models.Milestone.title)
+        .select_from(models.ChildProfile)
+        .outerjoin(
+            models.Milestone,
+            (models.Milestone.child_id == models.ChildProfile.id)
+            & models.Milestone.achieved.is_(True),
         )
-    return milestones
+        .where(models.ChildProfile.id == child_id)
+    )
+    rows = result.tuples().all()
+    if not rows:
+        return None
+    achieved = frozenset(row for row in rows if row[0] is not None)
+
+    # Template data is static and trusted, so skip per-request validation.
+    construct = schemas.MilestoneStatusOut.model_construct
+    return [
+        construct(age_phase=age_phase, focus=focus, title=title, achieved=key in achieved)
+        for age_phase, focus, title, key in _MILESTONE_TEMPLATES
+    ]
+
 
+def _personalization_signal_query(child_id: int):
+    """Build one statement returning 7-day pillar stats and the last 5 joy scores.
 
-async def _compute_completion_rate_7d(db: AsyncSession, child_id: int) -> float:
-    """Compute 7-day completion percentage for personalization decisions."""
+    Task rows come back as ("task", pillar, total, done, NULL) grouped by pillar;
+    check-in rows as ("joy", NULL, NULL, NULL, joy_score).
+    """
     start_date = date.today() - timedelta(days=6)
 
-    total_result = await db.execute(
-        select(func.count(models.DailyTask.id)).where(
-            models.DailyTask.child_id == child_id,
-            models.DailyTask.date_assigned >= start_date,
-        )
+    recent_joy = (
+        select(models.DailyCheckin.joy_score)
+        .where(models.DailyCheckin.child_id == child_id)
+        .order_by(models.DailyCheckin.checkin_date.desc())
+        .limit(5)
+        .cte("recent_joy")
     )
-    completed_result = await db.execute(
-        select(func.count(models.DailyTask.id)).where(
+    pillar_stats = (
+        select(
+            literal("task").label("source"),
+            models.DailyTask.pillar,
+            func.count().label("total"),
+            func.count().filter(models.DailyTask.completed.is_(True)).label("done"),
+            cast(null(), Integer).label("joy_score"),
+        )
+        .where(
             models.DailyTask.child_id == child_id,
             models.DailyTask.date_assigned >= start_date,
-            models.DailyTask.completed.is_(True),
         )
+        .group_by(models.DailyTask.pillar)
+    )
+    joy_scores = select(
+        literal("joy"),
+        cast(null(), String),
+        cast(null(), Integer),
+        cast(null(), Integer),
+        recent_joy.c.joy_score,
     )
+    return union_all(pillar_stats, joy_scores)
 
-    total = total_result.scalar_one() or 0
-    completed = completed_result.scalar_one() or 0
-    return (completed / total * 100.0) if total else 0.0
 
+def _completion_rate(totals: dict[str, int], completed: dict[str, int]) -> float:
+    """Compute completion percentage across all pillars."""
+    total = sum(totals.values())
+    return (sum(completed.values()) / total * 100.0) if total else 0.0
 
-async def _detect_low_pillar_7d(db: AsyncSession, child_id: int) -> str | None:
-    """Identify consistently weak pillar from last 7 days of task outcomes.
+
+def _detect_low_pillar(totals: dict[str, int], completed: dict[str, int]) -> str | None:
+    """Identify consistently weak pillar from per-pillar task outcomes.
 
     Rule: choose pillar with the lowest completion rate if it is meaningfully lower
     than the global average (>= 15 percentage points lower).
     """
-    start_date = date.today() - timedelta(days=6)
-
-    result = await db.execute(
-        select(models.DailyTask).where(
-            models.DailyTask.child_id == child_id,
-            models.DailyTask.date_assigned >= start_date,
-        )
-    )
-    rows = result.scalars().all()
-    if not rows:
+    if not totals:
         return None
 
-    totals: dict[str, int] = defaultdict(int)
-    completed: dict[str, int] = defaultdict(int)
-    for row in rows:
-        totals[row.pillar] += 1
-        if row.completed:
-            completed[row.pillar] += 1
-
     rates: dict[str, float] = {
         pillar: (completed[pillar] / totals[pillar] * 100.0) for pillar in totals
     }
-    global_rate = sum(completed.values()) / sum(totals.values()) * 100.0
+    global_rate = _completion_rate(totals, completed)
 
     low_pillar = min(rates, key=rates.get)
     if rates[low_pillar] <= global_rate - 15:
@@ -126,15 +168,8 @@ async def _detect_low_pillar_7d(db: AsyncSession, child_id: int) -> str | None:
     return None
 
 
-async def _joy_low_streak_5d(db: AsyncSession, child_id: int) -> bool:
+def _joy_low_streak(scores: list[int]) -> bool:
     """Check if joy_score stayed below 3 for the last 5 check-ins."""
-    result = await db.execute(
-        select(models.DailyCheckin.joy_score)
-        .where(models.DailyCheckin.child_id == child_id)
-        .order_by(models.DailyCheckin.checkin_date.desc())
-        .limit(5)
-    )
-    scores = list(result.scalars().all())
     if len(scores) < 5:
         return False
     return all(score < 3 for score in scores)
@@ -144,94 +179,121 @@ async def _build_personalization_signal(
     db: AsyncSession,
     child_id: int,
 ) -> ai_generator.PersonalizationSignal:
-    """Aggregate behavioral signals used by AI task personalization rules."""
-    completion_rate_7d = await _compute_completion_rate_7d(db, child_id)
-    low_pillar = await _detect_low_pillar_7d(db, child_id)
-    joy_below_three_streak_5d = await _joy_low_streak_5d(db, child_id)
+    """Aggregate behavioral signals used by AI task personalization rules.
+
+    All signals come from a single round-trip: 7-day per-pillar completion
+    counts and the five most recent joy scores.
+    """
+    result = await db.execute(_personalization_signal_query(child_id))
+
+    totals: dict[str, int] = {}
+    completed: dict[str, int] = {}
+    joy_scores: list[int] = []
+    for source, pillar, total, done, joy_score in result.all():
+        if source == "joy":
+            joy_scores.append(joy_score)
+        else:
+            totals[pillar] = int(total)
+            completed[pillar] = int(done)
 
     return ai_generator.PersonalizationSignal(
-        completion_rate_7d=completion_rate_7d,
-        low_pillar=low_pillar,
-        joy_below_three_streak_5d=joy_below_three_streak_5d,
+        completion_rate_7d=_completion_rate(totals, completed),
+        low_pillar=_detect_low_pillar(totals, completed),
+        joy_below_three_streak_5d=_joy_low_streak(joy_scores),
     )
 
 
-async def generate_daily_plan(db: AsyncSession, child_id: int) -> list[models.DailyTask]:
+async def generate_daily_plan(db: AsyncSession, child_id: int) -> Sequence[RowMapping]:
     """Generate next tasks using personalized AI strategy and save today's plan."""
     profile = await get_profile(db, child_id)
     if profile is None:
         return []
 
-    age_years = max(0, (date.today() - profile.date_of_birth).days // 365)
-
     # Personalization: use recent completion, low-pillar trends, and joy streaks.
     signals = await _build_personalization_signal(db, child_id)
+    # End the read transaction so the pooled connection is not held through
+    # the model call; the insert below checks one out again.
+    await db.commit()
+
+    age_years = max(0, (date.today() - profile["date_of_birth"]).days // 365)
     generated = await ai_generator.generateDailyTasks(
         age=age_years,
-        parent_priority=profile.parent_priority,
+        parent_priority=profile["parent_priority"],
         signals=signals,
     )
 
-    created_tasks: list[models.DailyTask] = []
-    for task in generated:
-        row = models.DailyTask(
-            child_id=child_id,
-            pillar=task["pillar"],
-            title=task["title"],
-            description=task["description"],
-            duration_minutes=task["duration_minutes"],
-            difficulty_level=task["difficulty_level"],
-            date_assigned=date.today(),
-        )
-        db.add(row)
-        created_tasks.append(row)
-
+    # One INSERT ... RETURNING for the whole plan instead of per-row refreshes.
+    today = date.today()
+    statement = insert(models.DailyTask).returning(
+        *_TASK_COLUMNS, sort_by_parameter_order=True
+    )
+    result = await db.execute(
+        statement,
+        [
+            {
+                "child_id": child_id,
+                "pillar": task["pillar"],
+                "title": task["title"],
+                "description": task["description"],
+                "duration_minutes": task["duration_minutes"],
+                "difficulty_level": task["difficulty_level"],
+                "date_assigned": today,
+            }
+            for task in generated
+        ],
+    )
+    created_tasks = result.mappings().all()
     await db.commit()
-    for task in created_tasks:
-        await db.refresh(task)
     return created_tasks
 
 
 async def update_task_status(
     db: AsyncSession, task_id: int, completed: bool
-) -> models.DailyTask | None:
-    """Mark a task complete/incomplete and set completion timestamp accordingly."""
-    result = await db.execute(select(models.DailyTask).where(models.DailyTask.id == task_id))
-    task = result.scalar_one_or_none()
+) -> RowMapping | None:
+    """Mark a task complete/incomplete and set completion timestamp accordingly.
+
+    A single UPDATE ... RETURNING both applies the change and reads the row back.
+    """
+    result = await db.execute(
+        update(models.DailyTask)
+        .where(models.DailyTask.id == task_id)
+        .values(
+            completed=completed,
+            completion_timestamp=datetime.utcnow() if completed else None,
+        )
+        .returning(*_TASK_COLUMNS)
+    )
+    task = result.mappings().one_or_none()
     if task is None:
         return None
-
-    task.completed = completed
-    task.completion_timestamp = datetime.utcnow() if completed else None
     await db.commit()
-    await db.refresh(task)
     return task
 
 
 async def fetch_weekly_progress(db: AsyncSession, child_id: int) -> schemas.WeeklyProgress:
-    """Compute weekly completion ratio for dashboard charting."""
+    """Compute weekly completion ratio for dashboard charting.
+
+    Postgres returns just the two counts for the Monday-to-Sunday window.
+    """
     today = date.today()
     week_start = today - timedelta(days=today.weekday())
+    week_end = week_start + timedelta(days=7)
 
-    total_result = await db.execute(
-        select(func.count(models.DailyTask.id)).where(
-            models.DailyTask.child_id == child_id,
-            models.DailyTask.date_assigned >= week_start,
-        )
-    )
-    completed_result = await db.execute(
-        select(func.count(models.DailyTask.id)).where(
+    result = await db.execute(
+        select(
+            func.count(),
+            func.count().filter(models.DailyTask.completed.is_(True)),
+        ).where(
             models.DailyTask.child_id == child_id,
             models.DailyTask.date_assigned >= week_start,
-            models.DailyTask.completed.is_(True),
+            models.DailyTask.date_assigned < week_end,
         )
     )
-
-    total_tasks = total_result.scalar_one() or 0
-    completed_tasks = completed_result.scalar_one() or 0
+    total_tasks, completed_tasks = result.one()
     rate = (completed_tasks / total_tasks) if total_tasks else 0.0
 
-    return schemas.WeeklyProgress(
+    # Counts come straight from the aggregate, so skip response validation.
+    return schemas.WeeklyProgress.model_construct(
         child_id=child_id,
         week_start=week_start,
         total_tasks=total_tasks,
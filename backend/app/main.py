@@ -1,23 +1,48 @@
 """FastAPI app entrypoint for LifeOS 0-21 backend."""
 
+import asyncio
 from contextlib import asynccontextmanager
+import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
-from .database import Base, engine
+from . import clock
+from .ai_generator import close_http_client
+from .database import Base, DBSessionMiddleware, engine
 from .routers import daily_plan, milestones, tasks, users
 
 
-@asynccontextmanager
-async def lifespan(_: FastAPI):
-    """Create DB tables at startup for local bootstrap.
+# Opt-in table bootstrap for local development (LIFEOS_AUTO_CREATE=1).
+# Production schemas are managed with Alembic migrations instead.
+AUTO_CREATE_TABLES = os.getenv("LIFEOS_AUTO_CREATE") == "1"
+
+# Advisory lock key so only one worker at a time runs create_all.
+SCHEMA_BOOTSTRAP_LOCK_ID = 0x4C4946454F53  # "LIFEOS"
+
 
-    In production, replace with Alembic migrations.
-    """
+async def _create_tables() -> None:
+    """Create missing DB tables, serialized across workers by an advisory lock."""
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Released at transaction end; later workers then find the tables present.
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": SCHEMA_BOOTSTRAP_LOCK_ID},
+            )
         await conn.run_sync(Base.metadata.create_all)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Optionally create DB tables at startup and run background housekeeping."""
+    if AUTO_CREATE_TABLES:
+        await _create_tables()
+    date_refresher = asyncio.create_task(clock.refresh_today())
     yield
+    date_refresher.cancel()
+    await close_http_client()
 
 
 app = FastAPI(
@@ -30,6 +55,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_middleware(DBSessionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],
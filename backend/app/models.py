@@ -1,14 +1,31 @@
 """SQLAlchemy ORM models for LifeOS 0-21 backend domain."""
 
 from datetime import date, datetime
+import sys
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
 
 
+class InternedString(TypeDecorator):
+    """VARCHAR whose loaded values are interned.
+
+    Used only for low-cardinality columns (pillars, difficulty levels, phases)
+    so every row shares one string object per distinct value. Free-text
+    columns must not use it: interned strings are never freed.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return sys.intern(value) if value is not None else None
+
+
 class ChildProfile(Base):
     """Represents a child profile managed by parent/guardian preferences."""
 
@@ -36,14 +53,24 @@ class DailyTask(Base):
     """Represents one assigned daily task under a development pillar."""
 
     __tablename__ = "daily_tasks"
+    # Plan, progress, and personalization queries filter by child and date range.
+    # INCLUDE columns let the count/group-by queries run as index-only scans.
+    __table_args__ = (
+        Index(
+            "ix_daily_tasks_child_date",
+            "child_id",
+            "date_assigned",
+            postgresql_include=["completed", "pillar"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     child_id: Mapped[int] = mapped_column(ForeignKey("child_profiles.id"), nullable=False)
-    pillar: Mapped[str] = mapped_column(String(50), nullable=False)
+    pillar: Mapped[str] = mapped_column(InternedString(50), nullable=False)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     duration_minutes: Mapped[int] = mapped_column(Integer, default=20)
-    difficulty_level: Mapped[str] = mapped_column(String(20), default="medium")
+    difficulty_level: Mapped[str] = mapped_column(InternedString(20), default="medium")
     completed: Mapped[bool] = mapped_column(Boolean, default=False)
     completion_timestamp: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     date_assigned: Mapped[date] = mapped_column(Date, default=date.today, nullable=False)
@@ -55,10 +82,19 @@ class Milestone(Base):
     """Tracks phase-based growth milestones for a child profile."""
 
     __tablename__ = "milestones"
+    # Covers the achieved-milestones lookup per child as an index-only scan.
+    __table_args__ = (
+        Index(
+            "ix_milestones_child_achieved",
+            "child_id",
+            postgresql_include=["age_phase", "title"],
+            postgresql_where=text("achieved IS TRUE"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     child_id: Mapped[int] = mapped_column(ForeignKey("child_profiles.id"), nullable=False)
-    age_phase: Mapped[str] = mapped_column(String(30), nullable=False)
+    age_phase: Mapped[str] = mapped_column(InternedString(30), nullable=False)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     achieved: Mapped[bool] = mapped_column(Boolean, default=False)
 
@@ -69,6 +105,10 @@ class DailyCheckin(Base):
     """Stores joy score and notes used for personalization of future tasks."""
 
     __tablename__ = "daily_checkins"
+    # Joy-streak lookups read a child's latest check-ins first.
+    __table_args__ = (
+        Index("ix_daily_checkins_child_date", "child_id", text("checkin_date DESC")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     child_id: Mapped[int] = mapped_column(ForeignKey("child_profiles.id"), nullable=False)
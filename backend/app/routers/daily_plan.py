@@ -1,12 +1,13 @@
 """Daily planning routes for AI-generated child tasks."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
 from ..database import get_db
+from ..routing import FastConstructRoute, NO_PROFILE
 
-router = APIRouter(prefix="/daily-plan", tags=["daily_plan"])
+router = APIRouter(prefix="/daily-plan", tags=["daily_plan"], route_class=FastConstructRoute)
 
 
 @router.get("/{child_id}", response_model=list[schemas.DailyTaskOut])
@@ -14,8 +15,9 @@ async def get_daily_plan(child_id: int, db: AsyncSession = Depends(get_db)):
     """Generate and return today's 5-task plan for a child profile."""
     tasks = await crud.generate_daily_plan(db, child_id)
     if not tasks:
-        raise HTTPException(status_code=404, detail="Child profile not found")
-    return tasks
+        raise NO_PROFILE.with_traceback(None)
+    construct = schemas.DailyTaskOut.model_construct
+    return [construct(**task) for task in tasks]
 
 
 @router.get("/{child_id}/weekly-progress", response_model=schemas.WeeklyProgress)
@@ -1,19 +1,35 @@
 """Milestone routes for developmental phase tracking."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
+from ..cache import route_cache
 from ..database import get_db
+from ..routing import FastConstructRoute, NO_PROFILE, conditional_json_response, json_adapter
 
-router = APIRouter(prefix="/milestones", tags=["milestones"])
+router = APIRouter(prefix="/milestones", tags=["milestones"], route_class=FastConstructRoute)
+
+# Encodes cached milestone status bodies; shared with the route class.
+_MILESTONES_JSON = json_adapter(list[schemas.MilestoneStatusOut])
 
 
 @router.get("/{child_id}", response_model=list[schemas.MilestoneStatusOut])
-async def list_milestones(child_id: int, db: AsyncSession = Depends(get_db)):
-    """Return milestone examples per phase with achieved status for a child."""
-    profile = await crud.get_profile(db, child_id)
-    if profile is None:
-        raise HTTPException(status_code=404, detail="Child profile not found")
+async def list_milestones(
+    child_id: int,
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+):
+    """Return milestone examples per phase with achieved status for a child.
 
-    return await crud.get_milestones_for_child(db, child_id)
+    Answers 304 with no body when If-None-Match carries the current ETag.
+    """
+    cache_key = route_cache.milestones_key(child_id)
+    body = await route_cache.get(cache_key)
+    if body is None:
+        milestones = await crud.get_profile_with_milestones(db, child_id)
+        if milestones is None:
+            raise NO_PROFILE.with_traceback(None)
+        body = _MILESTONES_JSON.dump_json(milestones)
+        await route_cache.set(cache_key, body)
+    return conditional_json_response(body, if_none_match)
@@ -1,12 +1,13 @@
 """Task update routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
 from ..database import get_db
+from ..routing import FastConstructRoute, NO_TASK
 
-router = APIRouter(prefix="/tasks", tags=["tasks"])
+router = APIRouter(prefix="/tasks", tags=["tasks"], route_class=FastConstructRoute)
 
 
 @router.post("/complete_task", response_model=schemas.DailyTaskOut)
@@ -17,5 +18,5 @@ async def complete_task(
     """Toggle task completion status."""
     updated = await crud.update_task_status(db, payload.task_id, payload.completed)
     if updated is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    return updated
+        raise NO_TASK.with_traceback(None)
+    return schemas.DailyTaskOut.model_construct(**updated)
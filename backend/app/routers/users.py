@@ -1,12 +1,17 @@
 """Child profile routes for LifeOS 0-21."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .. import crud, schemas
+from ..cache import route_cache
 from ..database import get_db
+from ..routing import FastConstructRoute, NO_PROFILE, conditional_json_response, json_adapter
 
-router = APIRouter(prefix="/profiles", tags=["profiles"])
+router = APIRouter(prefix="/profiles", tags=["profiles"], route_class=FastConstructRoute)
+
+# Encodes cached profile bodies; shared with the route class.
+_PROFILE_JSON = json_adapter(schemas.ChildProfileOut)
 
 
 @router.post("/", response_model=schemas.ChildProfileOut, status_code=status.HTTP_201_CREATED)
@@ -15,13 +20,24 @@ async def create_child_profile(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new child profile."""
-    return await crud.create_profile(db, payload)
+    profile = await crud.create_profile(db, payload)
+    await route_cache.invalidate_child(profile["id"])
+    return schemas.ChildProfileOut.model_construct(**profile)
 
 
 @router.get("/{child_id}", response_model=schemas.ChildProfileOut)
-async def get_child_profile(child_id: int, db: AsyncSession = Depends(get_db)):
-    """Fetch one child profile by ID."""
-    profile = await crud.get_profile(db, child_id)
-    if profile is None:
-        raise HTTPException(status_code=404, detail="Child profile not found")
-    return profile
+async def get_child_profile(
+    child_id: int,
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(default=None),
+):
+    """Fetch one child profile by ID, answering 304 when the ETag still matches."""
+    cache_key = route_cache.profile_key(child_id)
+    body = await route_cache.get(cache_key)
+    if body is None:
+        profile = await crud.get_profile(db, child_id)
+        if profile is None:
+            raise NO_PROFILE.with_traceback(None)
+        body = _PROFILE_JSON.dump_json(schemas.ChildProfileOut.model_construct(**profile))
+        await route_cache.set(cache_key, body)
+    return conditional_json_response(body, if_none_match)
@@ -0,0 +1,86 @@
+"""Custom FastAPI route classes and helpers shared by LifeOS 0-21 routers."""
+
+from collections.abc import Callable
+import functools
+import hashlib
+from typing import Any
+
+from fastapi import HTTPException, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+# Shared 404s raised by the routers. Raise them with `.with_traceback(None)` so a
+# reused instance does not keep accumulating traceback frames across requests.
+NO_PROFILE = HTTPException(status_code=404, detail="Child profile not found")
+NO_TASK = HTTPException(status_code=404, detail="Task not found")
+
+
+@functools.lru_cache(maxsize=None)
+def json_adapter(response_type: Any) -> TypeAdapter:
+    """Return the process-wide TypeAdapter for a response type, built once."""
+    return TypeAdapter(response_type)
+
+
+class FastConstructRoute(APIRoute):
+    """Route that serializes handler results without re-validating them.
+
+    Handlers on these routes return response models built with
+    `model_construct` (or lists of them) from already-typed DB rows. The declared
+    `response_model` still drives OpenAPI docs, but results are dumped straight
+    to JSON through pydantic-core instead of FastAPI's validate-then-encode path.
+    Handlers may still return a `Response` to bypass serialization entirely.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        response_model = kwargs.get("response_model")
+        if response_model is not None and not isinstance(response_model, DefaultPlaceholder):
+            endpoint = _serialize_constructed(
+                endpoint,
+                serializer=json_adapter(response_model),
+                status_code=kwargs.get("status_code") or 200,
+            )
+        super().__init__(path, endpoint, **kwargs)
+
+
+def _serialize_constructed(
+    endpoint: Callable[..., Any],
+    *,
+    serializer: TypeAdapter,
+    status_code: int,
+) -> Callable[..., Any]:
+    """Wrap an async endpoint so model results are returned as pre-encoded JSON."""
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        content = await endpoint(*args, **kwargs)
+        if isinstance(content, Response):
+            return content
+        return Response(
+            content=serializer.dump_json(content),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    return wrapper
+
+
+def etag_for(body: bytes) -> str:
+    """Return a weak ETag derived from an encoded response body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def conditional_json_response(body: bytes, if_none_match: str | None) -> Response:
+    """Return `body` as JSON, or an empty 304 if the client already holds it.
+
+    The ETag is content-derived, so it changes exactly when the encoded body
+    does, including cached bodies dropped by write-path invalidation.
+    """
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match is not None and (
+        if_none_match.strip() == "*"
+        or etag in (candidate.strip() for candidate in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,13 +1,44 @@
 """Pydantic request/response schemas for LifeOS 0-21 API."""
 
 from datetime import date, datetime
-from typing import Literal
+import sys
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+
+from .clock import today
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality strings so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+InternedStr = Annotated[str, BeforeValidator(_intern)]
+
+# Shared choice sets; pydantic-core validates Literal members with a hash lookup.
+Pillar = Annotated[
+    Literal["Cognitive", "Physical", "Language", "Character", "Creativity"],
+    BeforeValidator(_intern),
+]
+DifficultyLevel = Annotated[Literal["easy", "medium", "hard"], BeforeValidator(_intern)]
+
+
+class SchemaModel(BaseModel):
+    """Base for API schemas with the shared model configuration."""
+
+    model_config = ConfigDict(
+        validate_assignment=False,
+        extra="ignore",
+        arbitrary_types_allowed=False,
+    )
+
+
+_ORM_CONFIG = ConfigDict(from_attributes=True)
 
 
 # ---------- Child profile schemas ----------
-class ChildProfileBase(BaseModel):
+class ChildProfileBase(SchemaModel):
     """Shared profile fields used for create/read operations."""
 
     name: str
@@ -25,25 +56,25 @@ class ChildProfileOut(ChildProfileBase):
 
     id: int
 
-    model_config = {"from_attributes": True}
+    model_config = _ORM_CONFIG
 
 
 # ---------- Daily task schemas ----------
-class DailyTaskBase(BaseModel):
+class DailyTaskBase(SchemaModel):
     """Shared fields for daily task data."""
 
-    pillar: Literal["Cognitive", "Physical", "Language", "Character", "Creativity"]
+    pillar: Pillar
     title: str
     description: str
     duration_minutes: int = Field(20, ge=5, le=180)
-    difficulty_level: Literal["easy", "medium", "hard"] = "medium"
+    difficulty_level: DifficultyLevel = "medium"
 
 
 class DailyTaskCreate(DailyTaskBase):
     """Payload for inserting an assigned daily task."""
 
     child_id: int
-    date_assigned: date = Field(default_factory=date.today)
+    date_assigned: date = Field(default_factory=today)
 
 
 class DailyTaskOut(DailyTaskBase):
@@ -55,10 +86,10 @@ class DailyTaskOut(DailyTaskBase):
     completion_timestamp: datetime | None
     date_assigned: date
 
-    model_config = {"from_attributes": True}
+    model_config = _ORM_CONFIG
 
 
-class CompleteTaskRequest(BaseModel):
+class CompleteTaskRequest(SchemaModel):
     """Payload for marking one task complete/incomplete."""
 
     task_id: int
@@ -66,10 +97,10 @@ class CompleteTaskRequest(BaseModel):
 
 
 # ---------- Milestone schemas ----------
-class MilestoneBase(BaseModel):
+class MilestoneBase(SchemaModel):
     """Shared milestone fields."""
 
-    age_phase: str
+    age_phase: InternedStr
     title: str
     achieved: bool = False
 
@@ -86,20 +117,19 @@ class MilestoneOut(MilestoneBase):
     id: int
     child_id: int
 
-    model_config = {"from_attributes": True}
+    model_config = _ORM_CONFIG
 
 
-
-
-class MilestoneStatusOut(BaseModel):
+class MilestoneStatusOut(SchemaModel):
     """Milestone response with developmental phase examples and achieved status."""
 
-    age_phase: str
+    age_phase: InternedStr
     focus: str
     title: str
     achieved: bool
 
-class WeeklyProgress(BaseModel):
+
+class WeeklyProgress(SchemaModel):
     """Aggregated weekly completion stats for a child."""
 
     child_id: int